@@ -5,7 +5,7 @@
 #
 # Copyright (C) 2018  J. Michael Dyck <jmdyck@ibiblio.org>
 
-import sys, re, time, math, pdb
+import sys, re, time, math, pdb, multiprocessing, contextlib, io
 from collections import defaultdict
 
 from HTML import HNode
@@ -164,6 +164,9 @@ def analyze_sections():
     # Adding `self.algo._parent_foodefn = self`
     # caused spec.save to hit the default recursion limit (1000).
 
+    if n_jobs > 1:
+        prefetch_parses()
+
     for section in spec.doc_node.each_descendant_that_is_a_section():
         assert hasattr(section, 'ste')
 
@@ -249,6 +252,83 @@ def analyze_sections():
 
 # XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
 
+# If > 1, analyze_sections first parses the pseudocode blocks
+# in that many processes.
+n_jobs = 1
+
+def prefetch_parses():
+    # Each parse only depends on the spec text and a span of it,
+    # so we can do them in worker processes (forked after the parsers are created),
+    # and give each outcome to its parser,
+    # which uses it when (and if) `parse` asks for that span.
+    # So the blocks are still *handled* in the usual order,
+    # and the output is the same as without this.
+    #
+    # We don't know exactly which blocks analyze_sections will parse,
+    # so this is just the likely ones; anything else is parsed as usual,
+    # and any outcome that isn't asked for is ignored.
+
+    global g_parser_for_file_base_
+    g_parser_for_file_base_ = {}
+    tasks = []
+    def add_task(parser, start_posn, end_posn):
+        g_parser_for_file_base_[parser.file_base] = parser
+        tasks.append((parser.file_base, start_posn, end_posn))
+
+    for emu_alg in spec.doc_node.each_descendant_named('emu-alg'):
+        add_task(emu_alg_parser, emu_alg.inner_start_posn, emu_alg.inner_end_posn)
+
+    for emu_eqn in spec.doc_node.each_descendant_named('emu-eqn'):
+        if 'aoid' in emu_eqn.attrs:
+            add_task(emu_eqn_parser, emu_eqn.inner_start_posn, emu_eqn.inner_end_posn)
+
+    for section in spec.doc_node.each_descendant_that_is_a_section():
+        if section.section_kind == 'early_errors':
+            parser = ee_parser
+        elif section.section_kind == 'syntax_directed_operation':
+            parser = inline_sdo_parser
+        else:
+            continue
+        for ul in section.block_children:
+            if ul.element_name != 'ul': continue
+            for li in ul.children:
+                if li.element_name == 'li':
+                    add_task(parser, li.start_posn, li.end_posn)
+
+    stderr(f"prefetching {len(tasks)} parses in {n_jobs} processes...")
+    with multiprocessing.get_context('fork').Pool(n_jobs) as pool:
+        for (file_base, start_posn, end_posn, encoded_outcome) in pool.imap_unordered(
+            _parse_span_in_worker,
+            tasks,
+            chunksize=16
+        ):
+            if encoded_outcome is not None:
+                parser = g_parser_for_file_base_[file_base]
+                parser.prefetched_outcome_for_span_[(start_posn, end_posn)] = encoded_outcome
+
+    g_parser_for_file_base_ = None
+
+def _parse_span_in_worker(task):
+    (file_base, start_posn, end_posn) = task
+    parser = g_parser_for_file_base_[file_base]
+    captured_stderr = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(captured_stderr):
+            encoded_outcome = parser.encode_outcome(parser.parse_span(start_posn, end_posn))
+    except Exception:
+        # E.g., a tokenization error.
+        # If this span is asked for, the parent will hit it too
+        # (and report it), so drop whatever the worker printed about it.
+        encoded_outcome = None
+    else:
+        # The parent won't re-parse this span, so pass along anything printed.
+        sys.stderr.write(captured_stderr.getvalue())
+    return (file_base, start_posn, end_posn, encoded_outcome)
+
+g_parser_for_file_base_ = None
+
+# XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
+
 def analyze_early_errors_section(section):
 
     # XXX prose 'superstructure' outside early error rules:
@@ -1195,19 +1275,19 @@ def annotate_algo(algo):
             else:
                 assert 0, arg_list.prod.lhs_s
 
-        elif str(d.prod) == '{CONDITION_1} : {var} and {var} are in a race in {var}':
+        elif d.prod_str == '{CONDITION_1} : {var} and {var} are in a race in {var}':
             op_names = ['Races']
             args = [] # XXX
 
-        elif str(d.prod) == '{COMMAND} : Set fields of {var} with the values listed in {h_emu_xref}. {the_field_names_are_the_names_listed_etc}':
+        elif d.prod_str == '{COMMAND} : Set fields of {var} with the values listed in {h_emu_xref}. {the_field_names_are_the_names_listed_etc}':
             op_names = [ 'CreateBuiltinFunction', 'initializer for @@unscopables']
             args = [] # XXX
 
-        elif str(d.prod) == '{COMMAND} : IfAbruptRejectPromise({var}, {var}).':
+        elif d.prod_str == '{COMMAND} : IfAbruptRejectPromise({var}, {var}).':
             op_names = ['IfAbruptRejectPromise']
             args = d.children[0:2]
 
-        elif str(d.prod) in [
+        elif d.prod_str in [
             '{COMMAND} : ReturnIfAbrupt({EX}).',
             '{SMALL_COMMAND} : ReturnIfAbrupt({var})',
         ]:
@@ -5,7 +5,7 @@
 #
 # Copyright (C) 2018  J. Michael Dyck <jmdyck@ibiblio.org>
 
-import sys, collections, pdb, math, functools, os, re
+import sys, collections, pdb, math, functools, os, re, pickle, hashlib
 
 from LR_Parser import LR_Parser, ParsingError
 # import Earley
@@ -90,16 +90,34 @@ class Tokenizer:
 class Production:
     def __init__(self, is_token_prod, lhs_s, rhs_s):
         self.is_token_prod = is_token_prod
-        self.lhs_s = lhs_s
+        self.lhs_s = sys.intern(lhs_s)
         self.rhs_s = rhs_s
+        self._intern()
 
         # In a GLR parse, there can be lots of reductions
         # that ultimately don't appear in the final parse tree.
         self.n_reductions = 0
         self.n_delivered_instances = 0
 
+    def _intern(self):
+        # Code that dispatches on productions (e.g., static_type_analysis.py)
+        # wants the production's string form (prod_str) for every node it visits,
+        # so build it once, and also give the production an integer id (prod_id).
+        # Two Production objects with the same string get the same id.
+        self.prod_str = sys.intern(self.lhs_s + ' : ' + self.rhs_s)
+        self.prod_id = _prod_id_for_prod_str_.setdefault(self.prod_str, len(_prod_id_for_prod_str_))
+
+    def __setstate__(self, state):
+        # When a Production is unpickled (e.g., from spec.pickle),
+        # its prod_id must be re-assigned in the current process.
+        self.__dict__.update(state)
+        self.lhs_s = sys.intern(self.lhs_s)
+        self._intern()
+
     def __str__(self):
-        return self.lhs_s + ' : ' + self.rhs_s
+        return self.prod_str
+
+_prod_id_for_prod_str_ = {}
 
 indent_prod  = Production(True, '{_indent_}', '')
 outdent_prod = Production(True, '{_outdent_}', '')
@@ -196,6 +214,23 @@ tokenizer_for_pseudocode = Tokenizer(r'''
 tokenizer_for_RHSs_in_pseudocode_grammars = Tokenizer(r'''
 ''')
 
+class TokenBuffer:
+    # The tokens from `token_generator`, as a list that's only filled in
+    # as far as the parser has asked for, so that we don't tokenize
+    # all of a long algorithm before starting to parse it.
+
+    def __init__(self, token_generator):
+        self._token_generator = token_generator
+        self._tokens = []
+
+    def __getitem__(self, i):
+        while i >= len(self._tokens):
+            token_info = next(self._token_generator, None)
+            if token_info is None:
+                raise IndexError(i)
+            self._tokens.append(token_info)
+        return self._tokens[i]
+
 # XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
 
 class Pseudocode_Parser:
@@ -204,13 +239,7 @@ class Pseudocode_Parser:
 
         grammar_string = open(f"{os.path.dirname(__file__)}/{file_base}.grammar", 'r', encoding='utf-8').read()
 
-        self.productions = convert_grammar_string_to_productions(grammar_string)
-        simple_prods = [
-            (prod.lhs_s, prod.rhs_pieces)
-            for prod in self.productions
-        ]
-        # LR
-        self.lr_parser = LR_Parser('SLR(1)', simple_prods, 'silent')
+        (self.productions, self.lr_parser) = get_productions_and_lr_parser(file_base, grammar_string)
 
         #   # Earley (attempt, doesn't work)
         #   self.eparser = Earley.Parser(simple_prods, '*EOI*')
@@ -229,26 +258,32 @@ class Pseudocode_Parser:
         if self.group_errors_by_expectation:
             self.error_posns = collections.defaultdict(list)
 
-    def parse_and_handle_errors(self, start_posn, end_posn):
+        # Outcomes of parses done ahead of time, in other processes.
+        # (See Pseudocode.prefetch_parses.)
+        self.prefetched_outcome_for_span_ = {}
 
-        # hm
-        # Find the start of 'this line'
-        # (the line that contains start_posn)
-        for posn in range(start_posn, -1, -1):
-            if posn == 0 or shared.spec_text[posn-1] == '\n':
-                line_start_posn = posn
-                break
-        else:
-            assert 0
-        # And then find the end of this line's indentation
-        for posn in range(line_start_posn, start_posn+1):
-            if shared.spec_text[posn] != ' ':
-                line_indent_end_posn = posn
-                break
+        # For encoding and decoding ANodes.
+        self.prod_for_prod_key_ = self.productions + list(tokenizer_for_pseudocode.prod_for_pi.values())
+        # (Keyed by id(prod), not prod.prod_id, which is shared by productions with the same string.)
+        self.prod_key_for_id_of_prod_ = {
+            id(prod): prod_key
+            for (prod_key, prod) in enumerate(self.prod_for_prod_key_)
+        }
+
+    def parse_and_handle_errors(self, start_posn, end_posn):
+        encoded_outcome = self.prefetched_outcome_for_span_.pop((start_posn, end_posn), None)
+        if encoded_outcome is None:
+            outcome = self.parse_span(start_posn, end_posn)
         else:
-            assert 0
-        #
-        this_line_indentation = line_indent_end_posn - line_start_posn
+            outcome = self.decode_outcome(encoded_outcome)
+        return self.handle_outcome(outcome)
+
+    def parse_span(self, start_posn, end_posn):
+        # Parse the given span of the spec.
+        # Return ('error', expecting, posn) or ('parsed', results).
+        # (Leave the reporting to handle_outcome.)
+
+        this_line_indentation = shared.indentation_of_line_containing(start_posn)
 
         token_generator = tokenizer_for_pseudocode.tokenize(
             shared.spec_text,
@@ -258,10 +293,9 @@ class Pseudocode_Parser:
             this_line_indentation
         )
 
-        tokens = [ token_info for token_info in token_generator ]
+        tokens = TokenBuffer(token_generator)
 
         def matcher_for_gparse(curr_tind, terminals):
-            assert curr_tind < len(tokens)
             (tok_prod, tok_s_posn, tok_e_posn, tok_text) = tokens[curr_tind]
 
             matching_terminals = []
@@ -317,10 +351,17 @@ class Pseudocode_Parser:
             results = self.lr_parser.gparse(matcher_for_gparse, reducer, 0)
 
         except ParsingError as e:
-            self.error_count += 1
             (_, tok_s_posn, _, _) = tokens[e.posn]
+            return ('error', tuple(e.expecting), tok_s_posn)
+
+        return ('parsed', results)
+
+    def handle_outcome(self, outcome):
+        if outcome[0] == 'error':
+            (_, expecting, tok_s_posn) = outcome
+            self.error_count += 1
             if self.group_errors_by_expectation:
-                self.error_posns[tuple(e.expecting)].append(tok_s_posn)
+                self.error_posns[expecting].append(tok_s_posn)
             else:
                 print(
                     '\n'
@@ -331,12 +372,14 @@ class Pseudocode_Parser:
                     +
                     "Expecting: "
                     +
-                    ' '.join(e.expecting),
+                    ' '.join(expecting),
                     file=self.f_errors
                 )
             print('(Error)', file=self.f_parsed)
             return None
 
+        (_, results) = outcome
+
         if len(results) != 1:
             print('-------------------------------', file=self.f_ambig)
             for result in results:
@@ -360,6 +403,46 @@ class Pseudocode_Parser:
 
         return result
 
+    # ------------------------------------------------------
+    # An outcome from parse_span, in a form that's quicker to send between processes
+    # (and that refers to productions by index, so that the receiver
+    # gets its own Production objects, not copies).
+
+    def encode_outcome(self, outcome):
+        if outcome[0] == 'error':
+            return outcome
+        (_, results) = outcome
+        return ('parsed', [self.encode_anode(result) for result in results])
+
+    def encode_anode(self, anode):
+        return (
+            self.prod_key_for_id_of_prod_[id(anode.prod)],
+            anode.start_posn,
+            anode.end_posn,
+            [
+                child if isinstance(child, str) else self.encode_anode(child)
+                for child in anode.children
+            ]
+        )
+
+    def decode_outcome(self, encoded_outcome):
+        if encoded_outcome[0] == 'error':
+            return encoded_outcome
+        (_, encoded_results) = encoded_outcome
+        return ('parsed', [self.decode_anode(e) for e in encoded_results])
+
+    def decode_anode(self, encoded_anode):
+        (prod_key, start_posn, end_posn, encoded_children) = encoded_anode
+        return ANode(
+            self.prod_for_prod_key_[prod_key],
+            [
+                e if isinstance(e, str) else self.decode_anode(e)
+                for e in encoded_children
+            ],
+            start_posn,
+            end_posn
+        )
+
     def report(self):
         report_file_base = self.file_base + '_prod_counts'
         shared.stderr(f"generating new {report_file_base} ...")
@@ -390,6 +473,63 @@ class Pseudocode_Parser:
 
 nt_pattern = r'\{[A-Z_][A-Z_0-9]*\}'
 
+# (benchmark_spec.py turns this off, to time the construction.)
+use_parser_cache = True
+
+def get_productions_and_lr_parser(file_base, grammar_string):
+    # Constructing the LR_Parser (especially for emu_alg) takes a while,
+    # so we cache the productions and parser in the output dir
+    # (as {file_base}_parser.pickle),
+    # keyed by a hash of the grammar and of the code that processes it.
+    if shared.g_outdir is None or not use_parser_cache:
+        # testing or benchmarking
+        return make_productions_and_lr_parser(grammar_string)
+
+    h = hashlib.sha1(grammar_string.encode('utf-8'))
+    for module_name in [__name__, LR_Parser.__module__]:
+        with open(sys.modules[module_name].__file__, 'rb') as f:
+            h.update(f.read())
+    key = h.hexdigest()
+
+    cache_path = os.path.join(shared.g_outdir, file_base + '_parser.pickle')
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                # The key is pickled separately, so a stale cache
+                # can be detected without loading the rest.
+                if pickle.load(f) == key:
+                    return pickle.load(f)
+        except Exception as e:
+            shared.stderr(f"can't load {cache_path} ({e}), so rebuilding it")
+
+    (productions, lr_parser) = make_productions_and_lr_parser(grammar_string)
+
+    try:
+        if not os.path.exists(shared.g_outdir):
+            os.mkdir(shared.g_outdir)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(key, f)
+            pickle.dump((productions, lr_parser), f)
+    except Exception as e:
+        shared.stderr(f"can't cache the {file_base} parser ({e})")
+        # Don't leave a partial file (if open() even got that far).
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+
+    return (productions, lr_parser)
+
+def make_productions_and_lr_parser(grammar_string):
+    productions = convert_grammar_string_to_productions(grammar_string)
+    simple_prods = [
+        (prod.lhs_s, prod.rhs_pieces)
+        for prod in productions
+    ]
+    # LR
+    lr_parser = LR_Parser('SLR(1)', simple_prods, 'silent')
+    return (productions, lr_parser)
+
 def convert_grammar_string_to_productions(grammar_string):
 
     lhs_set = set()
@@ -502,6 +642,14 @@ class ANode(SpecNode):
         self.prod = prod
         self.children = children
 
+    @property
+    def prod_str(self):
+        return self.prod.prod_str
+
+    @property
+    def prod_id(self):
+        return self.prod.prod_id
+
     def set_parent_links(self):
         if self.children:
             for child in self.children:
@@ -542,9 +690,9 @@ class ANode(SpecNode):
     def printTree(self, f=sys.stdout, level=0):
         indentation = '  '*level
         if self.children == []:
-            print(indentation + '(' + str(self.prod) + ')', file=f)
+            print(indentation + '(' + self.prod_str + ')', file=f)
         else:
-            print(indentation + '(' + str(self.prod), file=f)
+            print(indentation + '(' + self.prod_str, file=f)
             for child in self.children:
                 if isinstance(child, str):
                     print(indentation + '  ' + literalize(child), file=f)
@@ -13,13 +13,28 @@ class Tokenizer:
             TokenSpec(token_pattern, token_response)
             for (token_pattern, token_response) in token_spec
         ]
+        self.candidate_specs_for_char_ = {}
+
+    def candidate_specs_for_char(self, c):
+        # Return (in order) the token_specs that might match at a position
+        # where the next character is `c`.
+        # (Rather than trying every token_spec at every offset.)
+        specs = self.candidate_specs_for_char_.get(c)
+        if specs is None:
+            specs = [
+                token_spec
+                for token_spec in self.token_specs
+                if token_spec.first_chars is None or c in token_spec.first_chars
+            ]
+            self.candidate_specs_for_char_[c] = specs
+        return specs
 
     def tokenize(self, r_line):
         tokens = []
         offset = 0
         while offset < len(r_line):
             matches = []
-            for token_spec in self.token_specs:
+            for token_spec in self.candidate_specs_for_char(r_line[offset]):
                 mo = token_spec.reo.match(r_line, offset)
                 if mo:
                     assert mo.start(0) == offset
@@ -93,8 +108,39 @@ class TokenSpec:
         self.pattern = pattern
         self.response = response
         self.reo = re.compile(pattern)
+        self.first_chars = first_chars_of_pattern(pattern)
         self.n_matches = 0
 
+def first_chars_of_pattern(pattern):
+    # Return the set of characters that a match of `pattern` must start with,
+    # or None if it isn't obvious.
+    # (This only understands a leading literal character, escaped punctuation,
+    # or simple character class.)
+    if '|' in pattern:
+        # Maybe an alternation.
+        return None
+
+    mo = re.match(r'\\([^\w\s])|([^\\.^$*+?{}\[\]|()])|\[([^\\\]^][^\\\]]*)\]', pattern)
+    if mo is None:
+        return None
+    if pattern[mo.end():mo.end()+1] in ['*', '?', '{']:
+        # The first thing is optional.
+        return None
+
+    (escaped, literal, class_content) = mo.groups()
+    if escaped is not None:
+        return {escaped}
+    elif literal is not None:
+        return {literal}
+    else:
+        chars = set()
+        for (a, b, c) in re.findall(r'(.)-(.)|(.)', class_content):
+            if c:
+                chars.add(c)
+            else:
+                chars.update(chr(i) for i in range(ord(a), ord(b)+1))
+        return chars
+
 class TokenizationError(Exception):
     pass
 
@@ -13,12 +13,19 @@ import shared
 from shared import stderr, header, msg_at_posn, spec
 
 def main():
-    if len(sys.argv) != 3:
-        stderr("usage: %s <output-dir> <spec.html>" % sys.argv[0])
+    args = sys.argv[1:]
+    if args:
+        mo = re.fullmatch(r'-jobs=(\d+)', args[0])
+        if mo:
+            Pseudocode.n_jobs = int(mo.group(1))
+            assert Pseudocode.n_jobs >= 1
+            args = args[1:]
+
+    if len(args) != 2:
+        stderr("usage: %s [-jobs=N] <output-dir> <spec.html>" % sys.argv[0])
         sys.exit(1)
 
-    outdir = sys.argv[1]
-    spec_path = sys.argv[2]
+    (outdir, spec_path) = args
 
     shared.register_output_dir(outdir)
 
@@ -637,11 +644,11 @@ def check_intrinsics():
 # XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
 # XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
 
-if 1:
+if __name__ == '__main__':
     main()
-else:
-    import cProfile
-    cProfile.run('main()', '_prof')
+    # To profile, instead:
+    # import cProfile
+    # cProfile.run('main()', '_prof')
     # python3 -m pstats
     # read _prof
     # sort time
@@ -0,0 +1,303 @@
+#!/usr/bin/python3
+
+# ecmaspeak-py/benchmark_spec.py:
+# Time the phases of analyze_spec.py, render_spec.py and static_type_analysis.py,
+# and flag any that have gotten slower since the previous run.
+#
+# Copyright (C) 2018  J. Michael Dyck <jmdyck@ibiblio.org>
+
+import sys, os, re, time, json, hashlib, tracemalloc, cProfile, pstats, pdb
+
+import shared
+from shared import stderr, spec
+
+def usage():
+    stderr("usage: %s [--stages=analyze,render,sta] [--threshold=PCT] [--calls] [--memory] <output-dir> <spec.html>" % sys.argv[0])
+    sys.exit(1)
+
+def main():
+    stage_names = ['analyze', 'render', 'sta']
+    threshold_pct = 10.0
+    count_calls = False
+    trace_memory = False
+
+    args = sys.argv[1:]
+    while args and args[0].startswith('--'):
+        arg = args.pop(0)
+        mo = re.fullmatch(r'--stages=([\w,]+)', arg)
+        if mo:
+            stage_names = mo.group(1).split(',')
+            for stage_name in stage_names:
+                if stage_name not in phases_for_stage_:
+                    usage()
+            continue
+        mo = re.fullmatch(r'--threshold=(\d+(?:\.\d*)?)', arg)
+        if mo:
+            threshold_pct = float(mo.group(1))
+            continue
+        if arg == '--calls':
+            # Call counts come from cProfile,
+            # which makes everything slower,
+            # so such runs aren't compared to runs without it.
+            count_calls = True
+            continue
+        if arg == '--memory':
+            # Likewise for measuring each phase's peak memory with tracemalloc.
+            trace_memory = True
+            continue
+        usage()
+
+    if len(args) != 2: usage()
+    (outdir, spec_path) = args
+
+    shared.register_output_dir(outdir)
+
+    # The scripts cache some results between runs
+    # (the pseudocode parsers, and static_type_analysis's cluster results),
+    # which would make the timings depend on what was run before.
+    # So don't use those caches here.
+    import Pseudocode_Parser
+    Pseudocode_Parser.use_parser_cache = False
+
+    # The spec is a fixed snapshot, but just in case,
+    # only compare runs that were on the same spec text.
+    with open(spec_path, 'rb') as f:
+        spec_digest = hashlib.sha1(f.read()).hexdigest()
+
+    this_run = {
+        'when': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'spec_path': spec_path,
+        'spec_sha1': spec_digest,
+        'calls_counted': count_calls,
+        'memory_traced': trace_memory,
+        'phases': [],
+    }
+
+    if trace_memory:
+        tracemalloc.start()
+
+    # Each stage starts from the spec.pickle that the previous one left,
+    # the same as if you'd run the scripts one after another.
+    for stage_name in stage_names:
+        for (phase_name, phase_func) in phases_for_stage_[stage_name]:
+            this_run['phases'].append(
+                run_phase(stage_name + ':' + phase_name, phase_func, spec_path, count_calls, trace_memory)
+            )
+
+    history_path = os.path.join(outdir, 'benchmark_history.json')
+    if os.path.exists(history_path):
+        with open(history_path, 'r', encoding='utf-8') as f:
+            history = json.load(f)
+    else:
+        history = []
+
+    prev_run = None
+    for run in reversed(history):
+        if (
+            run['spec_sha1'] == spec_digest
+            and run['calls_counted'] == count_calls
+            and run.get('memory_traced', False) == trace_memory
+        ):
+            prev_run = run
+            break
+
+    n_regressions = report(this_run, prev_run, threshold_pct)
+
+    history.append(this_run)
+    with open(history_path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=1)
+
+    if n_regressions > 0:
+        sys.exit(2)
+
+# XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
+
+def run_phase(phase_name, phase_func, spec_path, count_calls, trace_memory):
+    stderr(f"benchmarking {phase_name} ...")
+
+    if trace_memory:
+        # (The process's peak RSS wouldn't do here:
+        # it only goes up, so it's mostly a measure of the earlier phases.)
+        tracemalloc.reset_peak()
+        (start_bytes, _) = tracemalloc.get_traced_memory()
+
+    if count_calls:
+        profiler = cProfile.Profile()
+        start_time = time.perf_counter()
+        profiler.runcall(phase_func, spec_path)
+        seconds = time.perf_counter() - start_time
+        n_calls = pstats.Stats(profiler).total_calls
+    else:
+        start_time = time.perf_counter()
+        phase_func(spec_path)
+        seconds = time.perf_counter() - start_time
+        n_calls = None
+
+    if trace_memory:
+        # How far this phase took memory use above where it started.
+        (_, peak_bytes) = tracemalloc.get_traced_memory()
+        peak_mib = (peak_bytes - start_bytes) / (1024 * 1024)
+    else:
+        peak_mib = None
+
+    return {
+        'name': phase_name,
+        'seconds': seconds,
+        'peak_mib': peak_mib,
+        'calls': n_calls,
+    }
+
+def report(this_run, prev_run, threshold_pct):
+    # Print a table of the phases of `this_run`,
+    # comparing each to the same phase in `prev_run` (if any).
+    # Return the number of phases that regressed by more than `threshold_pct`.
+
+    if prev_run is None:
+        prev_seconds_for_phase_ = {}
+    else:
+        prev_seconds_for_phase_ = {
+            phase['name']: phase['seconds']
+            for phase in prev_run['phases']
+        }
+
+    # A phase that takes a few milliseconds is all noise,
+    # so don't flag it, whatever the percentage.
+    min_seconds_to_flag = 0.1
+
+    n_regressions = 0
+    f = shared.open_for_output('benchmark_report')
+
+    def put(*args): print(*args, file=f)
+
+    if prev_run is None:
+        put("(no previous run on this spec to compare to)")
+    else:
+        put(f"compared to run of {prev_run['when']}, flagging slowdowns over {threshold_pct}%")
+    put()
+    put("   seconds   change    peak MiB        calls  phase")
+    for phase in this_run['phases']:
+        name = phase['name']
+        seconds = phase['seconds']
+        prev_seconds = prev_seconds_for_phase_.get(name)
+
+        if prev_seconds is None or prev_seconds == 0:
+            change_str = ''
+            flag = ''
+        else:
+            change_pct = 100.0 * (seconds - prev_seconds) / prev_seconds
+            change_str = '%+6.1f%%' % change_pct
+            if change_pct > threshold_pct and seconds - prev_seconds > min_seconds_to_flag:
+                n_regressions += 1
+                flag = '  <-- REGRESSION'
+            else:
+                flag = ''
+
+        calls_str = '' if phase['calls'] is None else str(phase['calls'])
+        peak_str = '' if phase['peak_mib'] is None else '%.1f' % phase['peak_mib']
+        put("%10.3f  %7s  %10s  %11s  %s%s" % (
+            seconds,
+            change_str,
+            peak_str,
+            calls_str,
+            name,
+            flag
+        ))
+    put()
+    put(f"{n_regressions} regressions")
+    f.close()
+
+    stderr(f"{n_regressions} phases regressed by more than {threshold_pct}%")
+    return n_regressions
+
+# XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
+# The phases of each script, mirroring their `main` functions.
+# (Each phase function takes the spec path, though most ignore it.)
+
+def _analyze_read(spec_path):
+    shared.msg_at_posn_start()
+    spec.read_source_file(spec_path)
+
+def _analyze_parse_html(spec_path):
+    import HTML
+    spec.doc_node = HTML.parse_and_validate()
+
+def _analyze_finish(spec_path):
+    shared.msg_at_posn_finish()
+    spec.save()
+
+def _analyze_phase(func_name):
+    def phase(spec_path):
+        import analyze_spec
+        getattr(analyze_spec, func_name)()
+    return (func_name, phase)
+
+def _module_phase(module_name, func_name):
+    def phase(spec_path):
+        module = __import__(module_name)
+        getattr(module, func_name)()
+    return (module_name + '.' + func_name, phase)
+
+def _render(spec_path):
+    import render_spec
+    f = shared.open_for_output('index.html')
+    render_spec._f = f
+    render_spec.render_node(spec.doc_node)
+    f.close()
+
+def _sta_levels(spec_path):
+    import static_type_analysis
+    global _sta_dependency_levels
+    _sta_dependency_levels = static_type_analysis.compute_dependency_levels()
+
+def _sta_analyze(spec_path):
+    import static_type_analysis
+    static_type_analysis.use_results_cache = False # see main()
+    static_type_analysis.do_static_type_analysis(_sta_dependency_levels)
+
+phases_for_stage_ = {
+    'analyze': [
+        ('read_source_file', _analyze_read),
+        ('HTML.parse_and_validate', _analyze_parse_html),
+        _analyze_phase('check_indentation'),
+        _analyze_phase('check_trailing_whitespace'),
+        _analyze_phase('check_characters'),
+        _analyze_phase('check_ids'),
+        _analyze_phase('check_tables'),
+        _analyze_phase('check_intrinsics'),
+        _module_phase('Section', 'make_and_check_sections'),
+        _module_phase('emu_grammars', 'do_stuff_with_emu_grammars'),
+        # Pseudocode.do_stuff_with_pseudocode, split up:
+        _module_phase('Pseudocode', 'create_all_parsers'),
+        _module_phase('Pseudocode', 'analyze_sections'),
+        _module_phase('Pseudocode', 'check_emu_alg_coverage'),
+        _module_phase('Pseudocode', 'check_emu_eqn_coverage'),
+        _module_phase('Pseudocode', 'report_all_parsers'),
+        _module_phase('Pseudocode', 'analyze_static_dependencies'),
+        _module_phase('Pseudocode', 'check_sdo_coverage'),
+        ('finish', _analyze_finish),
+    ],
+    'render': [
+        ('spec.restore', lambda spec_path: spec.restore()),
+        _module_phase('render_spec', 'prep_xrefs'),
+        _module_phase('render_spec', 'prep_autolinking'),
+        _module_phase('render_spec', 'prep_grammar'),
+        ('render_node', _render),
+    ],
+    'sta': [
+        ('spec.restore', lambda spec_path: spec.restore()),
+        _module_phase('static_type_analysis', 'add_line_info'),
+        _module_phase('static_type_analysis', 'add_styling'),
+        _module_phase('static_type_analysis', 'make_initial_headers'),
+        _module_phase('static_type_analysis', 'prep_for_STA'),
+        _module_phase('static_type_analysis', 'gather_nonterminals'),
+        ('compute_dependency_levels', _sta_levels),
+        ('do_static_type_analysis', _sta_analyze),
+    ],
+}
+
+_sta_dependency_levels = None
+
+if __name__ == '__main__':
+    main()
+
+# vim: sw=4 ts=4 expandtab
@@ -31,6 +31,10 @@ def do_stuff_with_emu_grammars():
     for (t, emu_grammars) in sorted(emu_grammars_of_type_.items()):
         stderr('    ', len(emu_grammars), t)
 
+    if packrat_max_entries:
+        n_lookups = packrat_n_hits + packrat_n_misses
+        stderr(f"simple_parse memo: {n_lookups} lookups, {packrat_n_hits} hits ({100.0 * packrat_n_hits / n_lookups if n_lookups else 0.0:.1f}%), {packrat_n_full} parses hit the size bound")
+
     process_defining_emu_grammars(emu_grammars_of_type_['definition'])
     check_reachability() # not that useful?
 
@@ -293,6 +297,17 @@ metagrammar = {
 
 # ------------------------------------------------------------------------------
 
+# simple_parse can attempt the same (goal, posn, indent) many times
+# (e.g., for different alternatives of a '|' goal),
+# so it keeps a memo table (per parse) of the results,
+# with at most this many entries. (0 disables it.)
+packrat_max_entries = 10000
+
+# Totals over all parses:
+packrat_n_hits = 0
+packrat_n_misses = 0
+packrat_n_full = 0 # number of parses whose memo table filled up
+
 def simple_parse(grammar, goal, start_posn, end_posn, start_indent):
     max_error_posn = start_posn
     max_error_expectations = []
@@ -307,7 +322,42 @@ def simple_parse(grammar, goal, start_posn, end_posn, start_indent):
 
     t = False # shared.spec_text.startswith('\n        ReservedWord', start_posn)
 
-    def attempt(goal, at_start_posn, at_start_indent, level):
+    memo = {}
+
+    def attempt_with_memo(goal, at_start_posn, at_start_indent, level):
+        nonlocal max_error_posn, max_error_expectations
+        global packrat_n_hits, packrat_n_misses, packrat_n_full
+
+        key = (goal, at_start_posn, at_start_indent)
+        entry = memo.get(key)
+        if entry is not None:
+            packrat_n_hits += 1
+            (r, error_posn, error_expectations) = entry
+        else:
+            packrat_n_misses += 1
+
+            # Collect the expectations logged by this attempt separately,
+            # so that a memo hit can log them again.
+            # (Only those at its max error posn can matter.)
+            outer_error_state = (max_error_posn, max_error_expectations)
+            (max_error_posn, max_error_expectations) = (-1, [])
+            r = attempt_uncached(goal, at_start_posn, at_start_indent, level)
+            (error_posn, error_expectations) = (max_error_posn, max_error_expectations)
+            (max_error_posn, max_error_expectations) = outer_error_state
+
+            # Don't memoize a zero-length match,
+            # in case the same node would then appear twice in the tree.
+            if r is None or r[0] > at_start_posn:
+                if len(memo) < packrat_max_entries:
+                    memo[key] = (r, error_posn, error_expectations)
+                    if len(memo) == packrat_max_entries:
+                        packrat_n_full += 1
+
+        for expectation in error_expectations:
+            maybe_log_expectation(error_posn, expectation)
+        return r
+
+    def attempt_uncached(goal, at_start_posn, at_start_indent, level):
         # Consider shared.spec_text[at_start_posn:end_posn]
         # and attempt to match some prefix of it to `goal`.
         # If it doesn't match, return None.
@@ -496,6 +546,8 @@ def simple_parse(grammar, goal, start_posn, end_posn, start_indent):
         else:
             assert 0, pkind
 
+    attempt = attempt_with_memo if packrat_max_entries else attempt_uncached
+
     # input('continue? ')
     r = attempt(goal, start_posn, start_indent, 0)
     if r is None:
@@ -6,7 +6,7 @@
 # Copyright (C) 2018  J. Michael Dyck <jmdyck@ibiblio.org>
 
 
-import json, pdb, unicodedata, sys, re
+import json, pdb, unicodedata, sys, re, itertools, io, bisect
 from collections import defaultdict
 from pprint import pprint # mainly for debugging
 import misc
@@ -74,6 +74,15 @@ T_EOI = mynamedtuple('T_EOI', 'n')
 def are_distinct(values):
     return len(set(values)) == len(values)
 
+def _guard_is_satisfied(guard, psettings):
+    if guard is None: return True
+    s = guard['s']
+    assert s in ['+', '~']
+    n = guard['n']
+    assert n in psettings
+    assert psettings[n] in ['+', '~']
+    return s == psettings[n]
+
 class _Earley:
 
     def __init__(this_parser, name, how_much_to_consume):
@@ -113,14 +122,135 @@ class _Earley:
 
         this_parser.cfps = [start_production] + cfps_from_file
 
-        n_points = 0
-        for prod in this_parser.cfps:
-            n_points += 1 + len(prod['rhs'])
+        # Number the points densely:
+        # the points of production #p are
+        # first_point_for_prod_num[p] + 0 .. first_point_for_prod_num[p] + len(rhs).
+        this_parser.first_point_for_prod_num = []
+        this_parser.point_prod_num = []
+        this_parser.point_dot_posn = []
+        for (i, prod) in enumerate(this_parser.cfps):
+            assert prod['n'] == i
+            this_parser.first_point_for_prod_num.append(len(this_parser.point_prod_num))
+            for dot_posn in range(1 + len(prod['rhs'])):
+                this_parser.point_prod_num.append(i)
+                this_parser.point_dot_posn.append(dot_posn)
+        n_points = len(this_parser.point_prod_num)
 
         this_parser.productions_with_lhs_ = defaultdict(list)
         for prod in this_parser.cfps:
             this_parser.productions_with_lhs_[prod['lhs']].append(prod)
 
+        # A 'psettings' (parameter settings) maps each parameter name
+        # to '+' or '~'. Each distinct psettings is interned:
+        # it's identified by its 'psettings key'
+        # (a sorted tuple of its (name, setting) pairs),
+        # and within an item, by a small integer id.
+        # `psettings_for_id_` maps each id to the equivalent dict.
+        this_parser.psettings_id_for_key_ = {}
+        this_parser.psettings_for_id_ = []
+        this_parser.empty_psettings_id = this_parser._intern_psettings([])
+
+        # Precompute, for every point whose rush-after-dot is a nonterminal,
+        # and every psettings that an item at that point can have,
+        # the result of performing "Predictor" on such an item.
+        this_parser.prediction_ = {}
+        for prod in this_parser.cfps:
+            if prod['n'] == 0: continue # its goal isn't known yet; see run()
+            param_names = prod['params']
+            for settings in itertools.product(['+', '~'], repeat=len(param_names)):
+                psettings_id = this_parser._intern_psettings(zip(param_names, settings))
+                first_point = this_parser.first_point_for_prod_num[prod['n']]
+                for (dot_posn, rush) in enumerate(prod['rhs']):
+                    if rush.rsymbol.T == 'GNT':
+                        this_parser._compute_prediction(first_point + dot_posn, psettings_id)
+
+        this_parser.reset_stats()
+
+    def reset_stats(this_parser):
+        # Counters that accumulate over calls to run(),
+        # for performance monitoring (e.g., test_parser.py --timing).
+        this_parser.n_sets = 0
+        this_parser.peak_items_per_set = 0
+        # Only the lexical parser's runs are memoized (see run_lexical in parse()).
+        this_parser.n_memo_hits = 0
+        this_parser.n_memo_misses = 0
+
+    def _intern_psettings(this_parser, pairs):
+        psettings_key = tuple(sorted(pairs))
+        psettings_id = this_parser.psettings_id_for_key_.get(psettings_key)
+        if psettings_id is None:
+            psettings_id = len(this_parser.psettings_for_id_)
+            this_parser.psettings_id_for_key_[psettings_key] = psettings_id
+            this_parser.psettings_for_id_.append(dict(psettings_key))
+        return psettings_id
+
+    def _compute_prediction(this_parser, point, psettings_id):
+        # Return (and remember) a pair:
+        # - the psettings id for the nonterminal after the dot at `point`
+        #   (i.e., its args, expanded wrt the psettings for `psettings_id`), and
+        # - the tuple of start points for that nonterminal's productions
+        #   whose guards are satisfied by those settings.
+        prod_num = this_parser.point_prod_num[point]
+        dot_posn = this_parser.point_dot_posn[point]
+        rsymbol = this_parser.cfps[prod_num]['rhs'][dot_posn].rsymbol
+        assert rsymbol.T == 'GNT'
+        psettings = this_parser.psettings_for_id_[psettings_id]
+
+        new_psettings_id = this_parser._intern_psettings(
+            Rsymbol_expand_args(rsymbol, psettings)
+        )
+        new_psettings = this_parser.psettings_for_id_[new_psettings_id]
+
+        start_points = tuple(
+            this_parser.first_point_for_prod_num[prod['n']]
+            for prod in this_parser.productions_with_lhs_[rsymbol.n]
+            if _guard_is_satisfied(prod['guard'], new_psettings)
+        )
+
+        prediction = (new_psettings_id, start_points)
+        this_parser.prediction_[(point, psettings_id)] = prediction
+        return prediction
+
+    def tabulate_points(this_parser):
+        # The cfps don't change once they're loaded (and prepped),
+        # so for each point, precompute the info that run() needs about it.
+        this_parser.point_info = [
+            this_parser._compute_point_info(point)
+            for point in range(len(this_parser.point_prod_num))
+        ]
+
+    def _compute_point_info(this_parser, point):
+        # Return a tuple:
+        # - the rush after the dot (or None if the dot is at the end),
+        # - its kind: 'terminal' or 'nonterminal' (or None),
+        # - the symbol under which an item at this point is filed,
+        #   if it doesn't depend on the item's psettings (otherwise None),
+        # - whether the point is final (the dot is at the end of the RHS).
+        prod_num = this_parser.point_prod_num[point]
+        dot_posn = this_parser.point_dot_posn[point]
+        rhs = this_parser.cfps[prod_num]['rhs']
+        if dot_posn == len(rhs):
+            return (None, None, '!end of rhs!', True)
+
+        assert dot_posn < len(rhs)
+        rush = rhs[dot_posn]
+        rsymbol = rush.rsymbol
+        if rsymbol is None:
+            # The start production's goal, which run() fills in.
+            return None
+        elif Rsymbol_is_nonterminal(rsymbol):
+            kind = 'nonterminal'
+            if any(arg.s == '?' for arg in rsymbol.a):
+                symbol = None
+            else:
+                symbol = Rsymbol_exify(rsymbol, {})
+        elif Rsymbol_is_terminal(rsymbol):
+            kind = 'terminal'
+            symbol = Rsymbol_exify(rsymbol, {})
+        else:
+            assert 0, rush
+        return (rush, kind, symbol, False)
+
     # -------------------------------------------------
 
     def run(
@@ -140,23 +270,6 @@ class _Earley:
             if trace_level_of_this_msg <= trace_level:
                 print(this_parser.trace_prefix, *args, file=trace_f)
 
-        def Rsymbol_get_rhs_start_points(rsymbol, psettings):
-            assert Rsymbol_is_nonterminal(rsymbol)
-            return [
-                (prod['n'], 0)
-                for prod in this_parser.productions_with_lhs_[rsymbol.n]
-                if guard_is_satisfied(prod['guard'], psettings)
-            ]
-
-        def guard_is_satisfied(guard, psettings):
-            if guard is None: return True
-            s = guard['s']
-            assert s in ['+', '~']
-            n = guard['n']
-            assert n in psettings
-            assert psettings[n] in ['+', '~']
-            return s == psettings[n]
-
         # -------------------------------------------
         # Roughly speaking, a 'Point' is a point in the grammar.
         # i.e., a point in the RHS of some production.
@@ -168,12 +281,16 @@ class _Earley:
         # (Unless you pass down a reference to it,
         # and every Item saves it as an instance variable,
         # but that seems excessive.)
+        #
+        # A Point is represented by an int
+        # (see the point numbering in _Earley.__init__).
 
         def Point_make(prod_num, dot_posn):
-            return (prod_num, dot_posn)
+            return this_parser.first_point_for_prod_num[prod_num] + dot_posn
 
         def Point_stringify(point):
-            (prod_num, dot_posn) = point
+            prod_num = this_parser.point_prod_num[point]
+            dot_posn = this_parser.point_dot_posn[point]
             prod = this_parser.cfps[prod_num] # XXX
             lhs = prod['lhs']
             params = prod.get('params', []) # XXX
@@ -188,16 +305,11 @@ class _Earley:
                 ' '.join(Rush_stringify(r) for r in rhs[dot_posn:])
             )
 
+        point_info = this_parser.point_info
+
         def Point_get_rush_after_dot(point):
-            (prod_num, dot_posn) = point
-            prod = this_parser.cfps[prod_num]
-            rhs = prod['rhs']
-            if dot_posn < len(rhs):
-                return rhs[dot_posn]
-            elif dot_posn == len(rhs):
-                return None
-            else:
-                assert 0
+            (rush, _, _, _) = point_info[point]
+            return rush
 
         def Point_advance(point, node):
             # Get the next point after `point`,
@@ -207,29 +319,26 @@ class _Earley:
             # But it's also the occasion to do any extra checks on `node`.
             # If `node` fails those checks, return None.
 
-            (prod_num, dot_posn) = point
-
             # pdb.set_trace()
 
-            prod = this_parser.cfps[prod_num]
-            assert dot_posn < len(prod['rhs'])
+            (rush, _, _, is_final) = point_info[point]
+            assert not is_final
             # We'd never be asked to advance from the last point in a production.
 
-            rush = prod['rhs'][dot_posn]
-
             # Does `node` qualify as an instance of `rush`?
             if node_matches_rush(node, rush):
-                return Point_make(prod_num, dot_posn+1)
+                return point + 1
             else:
                 return None
 
         def Point_get_prod(point):
-            (prod_num, dot_posn) = point
+            prod_num = this_parser.point_prod_num[point]
             prod = this_parser.cfps[prod_num]
             return prod
 
-        def Point_get_lhs_symbol(point, psettings):
-            (prod_num, _) = point
+        def Point_get_lhs_symbol(point, psettings_id):
+            psettings = this_parser.psettings_for_id_[psettings_id]
+            prod_num = this_parser.point_prod_num[point]
             prod = this_parser.cfps[prod_num]
             lhs_symname = prod['lhs']
             params_suffix = ''.join(
@@ -241,58 +350,81 @@ class _Earley:
 
         # -------------------------------------------
 
-        def Item_make(cause, transit_node, psettings, resulting_point):
-            return (cause, transit_node, psettings, resulting_point)
+        # An Item is represented by an int,
+        # which indexes the following parallel arrays:
+        item_cause = []        # the previous item, or (if no transit node) the EarleySet
+        item_transit_node = [] # the node that took `cause` to this item, or None
+        item_psettings_id = []
+        item_point = []
+        #
+        # Items are hash-consed:
+        # making an item that's equal to an existing one returns the existing one.
+        # (Causes and transit nodes are compared by identity,
+        # which is how the tuple representation's `==` effectively compared them.)
+        item_for_key_ = {}
+
+        def Item_make(cause, transit_node, psettings_id, resulting_point):
+            key = (cause, id(transit_node), psettings_id, resulting_point)
+            item = item_for_key_.get(key)
+            if item is None:
+                item = len(item_point)
+                item_cause.append(cause)
+                item_transit_node.append(transit_node)
+                item_psettings_id.append(psettings_id)
+                item_point.append(resulting_point)
+                item_for_key_[key] = item
+            return item
 
         def Item_stringify(item):
-            (_, _, psettings, point) = item
+            psettings = this_parser.psettings_for_id_[item_psettings_id[item]]
             return "_ _ {%s} %s" % (
                 ', '.join(setting+name for (name, setting) in sorted(psettings.items())),
-                Point_stringify(point)
+                Point_stringify(item_point[item])
             )
 
         def Item_get_rush_after_dot(item):
-            (_, _, _, point) = item
-            return Point_get_rush_after_dot(point)
+            return Point_get_rush_after_dot(item_point[item])
 
         def Item_advance(item, node):
-            (_, _, psettings, point) = item
-            new_point = Point_advance(point, node)
+            new_point = Point_advance(item_point[item], node)
             if new_point is None: return None
-            return Item_make(item, node, psettings, new_point)
+            return Item_make(item, node, item_psettings_id[item], new_point)
 
         def Item_get_symbol_after_dot(item):
-            (_, _, psettings, point) = item
-
-            rush = Point_get_rush_after_dot(point)
-            if rush is None:
-                return '!end of rhs!'
+            (rush, _, symbol, _) = point_info[item_point[item]]
+            if symbol is not None:
+                return symbol
             else:
+                psettings = this_parser.psettings_for_id_[item_psettings_id[item]]
                 return Rsymbol_exify(rush.rsymbol, psettings)
 
         def Item_get_derived_items(item, this_set):
-            (_, _, psettings, point) = item
+            psettings_id = item_psettings_id[item]
+            point = item_point[item]
 
-            rush = Point_get_rush_after_dot(point)
-            if rush is None:
+            (rush, kind, _, is_final) = point_info[point]
+            if is_final:
                 # There is no runit/rsymbol after the dot.
                 # I.e., the dot is at the end of the RHS.
                 #?? Don't perform "Completer" yet.
                 # for new_item in Item_reduce(item): yield new_item
                 pass
 
-            elif Rush_is_nonterminal(rush):
+            elif kind == 'nonterminal':
                 # Perform "Predictor":
                 rsymbol = rush.rsymbol
 
                 # if rush.pre: print("290 rush w pre:", Rush_stringify(rush))
 
-                new_psettings = dict(
-                    Rsymbol_expand_args(rsymbol, psettings)
-                )
+                prediction = this_parser.prediction_.get((point, psettings_id))
+                if prediction is None:
+                    # Only if the grammar passes a nonterminal
+                    # args that don't match its params.
+                    prediction = this_parser._compute_prediction(point, psettings_id)
+                (new_psettings_id, start_points) = prediction
 
-                for point in Rsymbol_get_rhs_start_points(rsymbol, new_psettings):
-                    yield Item_make(this_set, None, new_psettings, point)
+                for start_point in start_points:
+                    yield Item_make(this_set, None, new_psettings_id, start_point)
 
                 if rsymbol.o:
                     # make_terminal_node
@@ -301,7 +433,7 @@ class _Earley:
                     new_item = Item_advance(item, empty_node)
                     if new_item is not None: yield new_item
 
-            elif Rush_is_terminal(rush):
+            elif kind == 'terminal':
                 # Don't perform "Scanner" yet.
                 pass
 
@@ -310,10 +442,11 @@ class _Earley:
 
         def Item_reduce(item):
             trace(9, '    Item_reduce:', Item_stringify(item))
-            (_, _, psettings, point) = item
+            point = item_point[item]
+            psettings = this_parser.psettings_for_id_[item_psettings_id[item]]
 
             if 0:
-                lhs_symbol = Point_get_lhs_symbol(point, psettings)
+                lhs_symbol = Point_get_lhs_symbol(point, item_psettings_id[item])
                 trace(1, "reducing to %s ..." % lhs_symbol)
                 parent_node = make_Node_here(lhs_symbol, set_text_posn)
             else:
@@ -329,12 +462,12 @@ class _Earley:
 
             p_item = item
             while True:
-                (cause, transit_node, _, point) = p_item # XXX
+                transit_node = item_transit_node[p_item]
                 if transit_node is None:
-                    back_set = cause
+                    back_set = item_cause[p_item]
                     break
                 parent_node.push_child(transit_node)
-                p_item = cause
+                p_item = item_cause[p_item]
 
             # if not node_is_valid(parent_node): return
 
@@ -360,6 +493,10 @@ class _Earley:
                 trace(9, )
                 trace(9, f'new set at posn {text_posn}...')
                 this_set.items_with_dot_before_ = defaultdict(list)
+                # Alongside the (ordered) lists,
+                # a hashed index of the items in them,
+                # so that detecting a duplicate doesn't require a linear scan.
+                this_set.items = set()
 
         def Set_trace(tl, this_set):
             trace(tl, )
@@ -385,12 +522,13 @@ class _Earley:
         def Set_add_and_recurse(this_set, item, indent):
             symbol = Item_get_symbol_after_dot(item)
 
-            if item in this_set.items_with_dot_before_[symbol]:
+            if item in this_set.items:
                 # already there, don't have to do anything
                 return
 
             trace(9, "  ADDING %s" % indent + Item_stringify(item))
             this_set.items_with_dot_before_[symbol].append(item)
+            this_set.items.add(item)
 
             for new_item in Item_get_derived_items(item, this_set):
                 Set_add_and_recurse(this_set, new_item, indent+' ')
@@ -401,8 +539,8 @@ class _Earley:
             for (symbol, items) in sorted(this_set.items_with_dot_before_.items()):
                 # if Symbol_is_terminal(symbol):
                 for item in items:
-                    rush = Item_get_rush_after_dot(item)
-                    if rush is not None and Rush_is_terminal(rush) and rush not in result:
+                    (rush, kind, _, _) = point_info[item_point[item]]
+                    if kind == 'terminal' and rush not in result:
                         result.append(rush)
             return result
 
@@ -443,7 +581,7 @@ class _Earley:
                     pass # fall through to ParseError
 
                 else:
-                    (_, goal_node, _, _) = latest_accepting_item
+                    goal_node = item_transit_node[latest_accepting_item]
                     assert goal_node.symbol == goal_symname
                     if trace_level >= 2:
                         trace(2, 'returning prior acceptable:')
@@ -474,8 +612,10 @@ class _Earley:
         goal_rsymbol = GNT(n=goal_symname, a=[], o=False)
         goal_rush = Rush(rsymbol=goal_rsymbol, pre=None, post=None)
         this_parser.cfps[0]['rhs'][0] = goal_rush
+        this_parser._compute_prediction(Point_make(0,0), this_parser.empty_psettings_id)
+        point_info[Point_make(0,0)] = this_parser._compute_point_info(Point_make(0,0))
         # And make an item for it:
-        initial_item = Item_make(None, None, {}, Point_make(0,0))
+        initial_item = Item_make(None, None, this_parser.empty_psettings_id, Point_make(0,0))
         next_kernel_items = [initial_item]
 
         if this_parser.how_much_to_consume == 'as much as possible':
@@ -487,6 +627,9 @@ class _Earley:
 
             Set_close(eset, next_kernel_items)
 
+            this_parser.n_sets += 1
+            this_parser.peak_items_per_set = max(this_parser.peak_items_per_set, len(eset.items))
+
             if trace_level >= 3:
                 Set_trace(3, eset)
 
@@ -514,7 +657,7 @@ class _Earley:
                         trace(2, "%d items!" % len(accepting_items_here))
                         if trace_level >= 2:
                             for item in accepting_items_here:
-                                (_, node, _, _) = item
+                                node = item_transit_node[item]
                                 trace(2, '')
                                 node.dump(this_parser.trace_prefix + '   ', f=trace_f)
                         print('NEED TO RESOLVE AMBIGUITY', file=trace_f) # XXX
@@ -586,9 +729,10 @@ class _Earley:
                 trace(1, "results:")
                 valid_trees = []
                 for end_item in next_kernel_items:
-                    (prev_item, n0, _, _) = end_item
+                    n0 = item_transit_node[end_item]
                     assert n0.symbol == this_parser.end_of_input_rsymbol # this_parser.finished_goal_symbol
-                    (_, goal_node, _, _) = prev_item
+                    prev_item = item_cause[end_item]
+                    goal_node = item_transit_node[prev_item]
                     assert goal_node.symbol == goal_symname
                     trace(1, "  ", goal_node)
                     valid_trees.append(goal_node)
@@ -857,16 +1001,22 @@ def do_ASI_prep(cfps):
 
 # XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
 
-lexical = _Earley('lexical', 'as much as possible')
-syntactic = _Earley('syntactic', 'all')
-
-# _gather_character_sets(lexical.cfps)
-gather_char_sets(lexical.cfps)
-
-gather_ReservedWords(syntactic.cfps) # for "but not ReservedWord"
-do_ASI_prep(syntactic.cfps)
-
-# XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
+# Memo of lexical runs (see run_lexical in parse()), shared by all calls to parse().
+# Each key is (lexical goal, examined text, whether the end of text was examined),
+# and each value is (text printed to trace_f, template Node or None, ParseError info).
+_lexical_memo = {}
+# (lexical goal, first char) -> the set of lengths of examined text in the memo's keys
+_lexical_memo_lengths_ = defaultdict(set)
+# Runs that examine more text than this (e.g. long comments or string literals)
+# are unlikely to recur, so aren't worth remembering.
+_lexical_memo_max_chars = 64
+# To bound the memory it uses over many parses,
+# the memo is cleared whenever it reaches this many entries.
+_lexical_memo_max_entries = 100000
+
+def clear_lexical_memo():
+    _lexical_memo.clear()
+    _lexical_memo_lengths_.clear()
 
 def parse(source_text, goal_symname, trace_level=0, trace_f=sys.stdout):
     # Using the `lexical` and `syntactic` Parsers
@@ -1174,16 +1324,7 @@ def parse(source_text, goal_symname, trace_level=0, trace_f=sys.stdout):
 
         # ------------------------------
 
-        token = lexical.run(
-            text_posn,
-            lexical_goal,
-            _lexical_get_next_terminal_instances, # can create Node
-            _make_nonterminal_node,               # can create Node
-            _lexical_make_Node_here,              # can create Node
-            _lexical_node_matches_rush,
-            lexical_trace_level,
-            trace_f
-        )
+        token = run_lexical(text_posn, lexical_goal) # can create Node
 
         assert token is not None
         # because _Earley::run either returns a Node or raises a ParseError
@@ -1366,16 +1507,7 @@ def parse(source_text, goal_symname, trace_level=0, trace_f=sys.stdout):
         text_posn = start_text_posn
         while True:
             try:
-                non_token_node = lexical.run(
-                    text_posn,
-                    '_NonToken',
-                    _lexical_get_next_terminal_instances, # can create lexical Node 
-                    _make_nonterminal_node,               # can create Node
-                    _lexical_make_Node_here,              # can create Node
-                    _lexical_node_matches_rush,
-                    lexical_trace_level,
-                    trace_f
-                )
+                non_token_node = run_lexical(text_posn, '_NonToken') # can create lexical Node
             except ParseError:
                 # Not a problem,
                 # we've just consumed all the non-tokens,
@@ -1522,15 +1654,108 @@ def parse(source_text, goal_symname, trace_level=0, trace_f=sys.stdout):
 
     # ==========================================================================
 
+    def run_lexical(text_posn, lexical_goal):
+        # Run the lexical parser at `text_posn` with goal `lexical_goal`,
+        # returning a Node or raising a ParseError.
+        #
+        # The result of a lexical run depends only on the goal
+        # and the source text that the run actually examined.
+        # So we remember each result (relative to text_posn)
+        # under that text, in `_lexical_memo`,
+        # and then the common tokens (identifiers, punctuators, whitespace, ...)
+        # are only parsed once, rather than once per occurrence.
+        # Anything that hasn't been seen before (with the same goal
+        # and the same amount of examined text) falls back to the Earley parser.
+        nonlocal lexical_examined_end, lexical_examined_eoi
+
+        if lexical_trace_level > 0:
+            # Don't use the memo, so that the trace is complete.
+            return lexical.run(
+                text_posn,
+                lexical_goal,
+                _lexical_get_next_terminal_instances, # can create Node
+                _make_nonterminal_node,               # can create Node
+                _lexical_make_Node_here,              # can create Node
+                _lexical_node_matches_rush,
+                lexical_trace_level,
+                trace_f
+            )
+
+        first_char = source_text[text_posn:text_posn+1]
+        text_len = len(source_text)
+        for n_chars in _lexical_memo_lengths_[(lexical_goal, first_char)]:
+            examined_text = source_text[text_posn:text_posn+n_chars]
+            if len(examined_text) < n_chars: continue
+            for eoi in ([False, True] if text_posn + n_chars == text_len else [False]):
+                memo_entry = _lexical_memo.get((lexical_goal, examined_text, eoi))
+                if memo_entry is not None:
+                    lexical.n_memo_hits += 1
+                    (printed, template, error_info) = memo_entry
+                    if printed: trace_f.write(printed)
+                    if template is None:
+                        (rel_posn, item_strings) = error_info
+                        raise ParseError(text_posn + rel_posn, item_strings)
+                    return _relocated_copy(template, text_posn, source_text)
+
+        # Not in the memo, so actually run the lexical parser,
+        # noting how much of the text it examines (see below)
+        # and anything it prints.
+        lexical.n_memo_misses += 1
+        lexical_examined_end = text_posn
+        lexical_examined_eoi = False
+        capture_f = io.StringIO()
+        try:
+            node = lexical.run(
+                text_posn,
+                lexical_goal,
+                _lexical_get_next_terminal_instances, # can create Node
+                _make_nonterminal_node,               # can create Node
+                _lexical_make_Node_here,              # can create Node
+                _lexical_node_matches_rush,
+                lexical_trace_level,
+                capture_f
+            )
+            error = None
+        except ParseError as e:
+            node = None
+            error = e
+
+        printed = capture_f.getvalue()
+        if printed: trace_f.write(printed)
+
+        n_chars = lexical_examined_end - text_posn
+        if n_chars <= _lexical_memo_max_chars:
+            if len(_lexical_memo) >= _lexical_memo_max_entries:
+                clear_lexical_memo()
+            examined_text = source_text[text_posn:lexical_examined_end]
+            if node is None:
+                memo_entry = (printed, None, (error.posn - text_posn, error.kernel_item_strings))
+            else:
+                memo_entry = (printed, _relocated_copy(node, -text_posn, None), None)
+            _lexical_memo[(lexical_goal, examined_text, lexical_examined_eoi)] = memo_entry
+            _lexical_memo_lengths_[(lexical_goal, first_char)].add(n_chars)
+
+        if node is None: raise error
+        return node
+
+    # While the lexical parser runs, these track how much of source_text
+    # it has examined: every char before `lexical_examined_end`,
+    # and (if `lexical_examined_eoi`) the fact that the text ends there.
+    lexical_examined_end = 0
+    lexical_examined_eoi = False
+
     def _lexical_get_next_terminal_instances(text_posn, expected_terminal_rushes):
+        nonlocal lexical_examined_end, lexical_examined_eoi
 
         if text_posn > len(source_text):
             assert 0
         elif text_posn == len(source_text):
             # at end of source_text
+            lexical_examined_eoi = True
             return None
 
         c = source_text[text_posn]
+        lexical_examined_end = max(lexical_examined_end, text_posn+1)
 
         if lexical_trace_level >= 2:
             put("|+")
@@ -1600,12 +1825,15 @@ def parse(source_text, goal_symname, trace_level=0, trace_f=sys.stdout):
 
         elif post.T == 'LAX':
             # (LAX is only a *post* when it occurs at the end of the RHS.)
+            nonlocal lexical_examined_end, lexical_examined_eoi
             if node.end_posn >= len(source_text):
                 # There is no following source character,
                 # so the lookahead-exclusion can't be violated.
+                lexical_examined_eoi = True
                 return True
             else:
                 next_c = source_text[node.end_posn]
+                lexical_examined_end = max(lexical_examined_end, node.end_posn+1)
                 return not char_matches_any_of_the_symbols(next_c, post.ts)
 
         elif post.T == 'A_but_only_if':
@@ -1721,6 +1949,28 @@ class Node:
             any(child.contains_a(symbol) for child in self.children)
         )
 
+def _relocated_copy(root, delta, whole_text):
+    # Return a copy of the tree at `root`,
+    # with every position shifted by `delta`,
+    # and `whole_text` as the text that the positions refer to.
+    # (Done iteratively, because trees can get quite deep.)
+    root_copy = None
+    stack = [(root, None)]
+    while stack:
+        (node, parent_copy) = stack.pop()
+        copy = Node.__new__(Node)
+        copy.__dict__.update(node.__dict__)
+        copy.whole_text = whole_text
+        copy.start_posn += delta
+        copy.end_posn += delta
+        copy.children = []
+        if parent_copy is None:
+            root_copy = copy
+        else:
+            parent_copy.children.append(copy)
+        stack.extend((child, copy) for child in reversed(node.children))
+    return root_copy
+
 def escape(s):
     def uify(mo):
         c = mo.group(0)
@@ -1867,13 +2117,7 @@ def lexical_Rsymbol_matches_char(rsymbol, char):
     elif T == 'T_nc':
         n = rsymbol.n
         if n == 'USP':
-            #" Any other Unicode 'Space_Separator' code point
-            # (where, in this context, "other" means "other than SP and NBSP")
-            return (
-                unicodedata.category(char) == 'Zs'
-                and
-                char not in ['\u0020', '\u00a0']
-            )
+            return bool(char_class_flags(char) & _CC_USP)
         else:
             return (char == character_named_[n])
 
@@ -1883,26 +2127,150 @@ def lexical_Rsymbol_matches_char(rsymbol, char):
             return True
 
         elif p == 'ID_Start':
-            # see http://unicode.org/reports/tr31/
-            # "Unicode Identifier and Pattern Syntax"
-            Other_ID_Start = "\u1885\u1886\u309b\u309c\u2118\u212e"
-            cat = unicodedata.category(char)
-            return cat in ['Lu', 'Ll', 'Lt', 'Lm', 'Lo', 'Nl'] or char in Other_ID_Start
-            # XXX - Pattern_Syntax - Pattern_White_Space
+            return bool(char_class_flags(char) & _CC_ID_Start)
 
         elif p == 'ID_Continue':
-            Other_ID_Continue = "\u1369\u136A\u136b\u136c\u136d\u136e\u136f\u1370\u1371\u19d1\u00b7\u0387"
-            cat = unicodedata.category(char)
-            return (
-                cat in ['Lu', 'Ll', 'Lt', 'Lm', 'Lo', 'Nl', 'Mn', 'Mc', 'Nd', 'Pc']
-                # + Other_ID_Continue - Pattern_Syntax - Pattern_White_Space
-                or char in Other_ID_Continue
-            ) and char != '\u2e2f'
+            return bool(char_class_flags(char) & _CC_ID_Continue)
 
         else:
             assert 0, p
 
-        # See http://www.unicode.org/Public/10.0.0/ucd/PropList.txt
+    elif T == 'GNT':
+        assert rsymbol.a == []
+        assert rsymbol.o == False
+        assert rsymbol.n in char_set_bit_, rsymbol.n
+        return bool(char_class_flags(char) & char_set_bit_[rsymbol.n])
+
+    else:
+        assert 0, rsymbol
+
+# ------------------------------------------------------------------------------
+# Character classes
+#
+# lexical_Rsymbol_matches_char is called for every expected rush at every char,
+# so rather than compute unicodedata.category(char) (etc) each time,
+# we precompute each code point's membership in the classes it asks about,
+# as a byte of flags:
+
+_CC_ID_Start    = 0x01
+_CC_ID_Continue = 0x02
+_CC_USP         = 0x04
+# and then one bit for each of the char sets in char_set_ (see char_set_bit_).
+
+# For code points in the BMP, the flags are in a 64K bytearray;
+# for astral code points, they're in a table of ranges:
+# _astral_range_flags[i] applies to code points from _astral_range_starts[i]
+# up to (but not including) _astral_range_starts[i+1].
+_bmp_char_class_flags = None
+_astral_range_starts = None
+_astral_range_flags = None
+
+def char_class_flags(char):
+    cp = ord(char)
+    if cp < 0x10000:
+        return _bmp_char_class_flags[cp]
+    else:
+        i = bisect.bisect_right(_astral_range_starts, cp) - 1
+        return _astral_range_flags[i]
+
+def build_char_class_tables():
+    # (Must be called after gather_char_sets.)
+    global char_set_bit_, _bmp_char_class_flags, _astral_range_starts, _astral_range_flags
+
+    char_set_bit_ = {}
+    bit = _CC_USP << 1
+    for name in sorted(char_set_.keys()):
+        assert bit <= 0x80 # so that the flags fit in a byte
+        char_set_bit_[name] = bit
+        bit <<= 1
+
+    flags_for_cp_ = defaultdict(int)
+    for (name, chars) in char_set_.items():
+        for char in chars:
+            flags_for_cp_[ord(char)] |= char_set_bit_[name]
+
+    # These mirror the _char_is_* functions below,
+    # but only compute each code point's category once.
+    ID_Start_cats = set(['Lu', 'Ll', 'Lt', 'Lm', 'Lo', 'Nl'])
+    ID_Continue_cats = ID_Start_cats | set(['Mn', 'Mc', 'Nd', 'Pc'])
+    def flags_for_cp(cp):
+        char = chr(cp)
+        cat = unicodedata.category(char)
+        flags = flags_for_cp_[cp] if cp in flags_for_cp_ else 0
+        if cat in ID_Start_cats or char in _Other_ID_Start:
+            flags |= _CC_ID_Start
+        if (cat in ID_Continue_cats or char in _Other_ID_Continue) and char != '\u2e2f':
+            flags |= _CC_ID_Continue
+        if cat == 'Zs' and char not in ['\u0020', '\u00a0']:
+            flags |= _CC_USP
+        return flags
+
+    _bmp_char_class_flags = bytearray(flags_for_cp(cp) for cp in range(0x10000))
+
+    _astral_range_starts = []
+    _astral_range_flags = []
+    for cp in range(0x10000, sys.maxunicode+1):
+        flags = flags_for_cp(cp)
+        if not _astral_range_flags or flags != _astral_range_flags[-1]:
+            _astral_range_starts.append(cp)
+            _astral_range_flags.append(flags)
+
+    check_char_class_tables()
+
+def check_char_class_tables(exhaustive=False):
+    # Check the tables against the direct computations.
+    # An exhaustive check takes a few seconds,
+    # so by default just check a sample of code points:
+    # the members of the char sets, the code points around
+    # each astral range boundary, the special cases in the
+    # _char_is_* functions, and every 97th code point.
+    if exhaustive:
+        cps = range(sys.maxunicode+1)
+    else:
+        cps = set(range(0, sys.maxunicode+1, 97))
+        for chars in char_set_.values():
+            cps.update(ord(char) for char in chars)
+        for start in _astral_range_starts:
+            cps.update([start-1, start])
+        cps.update(ord(char) for char in _Other_ID_Start + _Other_ID_Continue + '\u2e2f\u0020\u00a0')
+        cps = sorted(cps)
+    for cp in cps:
+        char = chr(cp)
+        flags = char_class_flags(char)
+        assert bool(flags & _CC_ID_Start) == _char_is_ID_Start(char), cp
+        assert bool(flags & _CC_ID_Continue) == _char_is_ID_Continue(char), cp
+        assert bool(flags & _CC_USP) == _char_is_USP(char), cp
+        for (name, chars) in char_set_.items():
+            assert bool(flags & char_set_bit_[name]) == (char in chars), (cp, name)
+
+def _char_is_USP(char):
+    #" Any other Unicode 'Space_Separator' code point
+    # (where, in this context, "other" means "other than SP and NBSP")
+    return (
+        unicodedata.category(char) == 'Zs'
+        and
+        char not in ['\u0020', '\u00a0']
+    )
+
+_Other_ID_Start = "\u1885\u1886\u309b\u309c\u2118\u212e"
+_Other_ID_Continue = "\u1369\u136A\u136b\u136c\u136d\u136e\u136f\u1370\u1371\u19d1\u00b7\u0387"
+
+def _char_is_ID_Start(char):
+    # see http://unicode.org/reports/tr31/
+    # "Unicode Identifier and Pattern Syntax"
+    cat = unicodedata.category(char)
+    return cat in ['Lu', 'Ll', 'Lt', 'Lm', 'Lo', 'Nl'] or char in _Other_ID_Start
+    # XXX - Pattern_Syntax - Pattern_White_Space
+
+def _char_is_ID_Continue(char):
+    cat = unicodedata.category(char)
+    return (
+        cat in ['Lu', 'Ll', 'Lt', 'Lm', 'Lo', 'Nl', 'Mn', 'Mc', 'Nd', 'Pc']
+        # + Other_ID_Continue - Pattern_Syntax - Pattern_White_Space
+        or char in _Other_ID_Continue
+    ) and char != '\u2e2f'
+
+    # See http://www.unicode.org/Public/10.0.0/ucd/PropList.txt
         # Other_ID_Start:
         #     6 code points:
         #     Mn: 1885 1886
@@ -1928,15 +2296,6 @@ def lexical_Rsymbol_matches_char(rsymbol, char):
         #     cats: Cc Cf Zl Zp Zs
         #     so "- Pattern_White_Space" has no effect in this version.
 
-    elif T == 'GNT':
-        assert rsymbol.a == []
-        assert rsymbol.o == False
-        assert rsymbol.n in char_set_, rsymbol.n
-        return (char in char_set_[rsymbol.n])
-
-    else:
-        assert 0, rsymbol
-
 def syntactic_terminal_node_if_token_matches_rsymbol(token, rsymbol):
 
     # print()
@@ -2026,6 +2385,22 @@ def syntactic_terminal_node_if_token_matches_rsymbol(token, rsymbol):
 
 # XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
 
+lexical = _Earley('lexical', 'as much as possible')
+syntactic = _Earley('syntactic', 'all')
+
+# _gather_character_sets(lexical.cfps)
+gather_char_sets(lexical.cfps)
+build_char_class_tables()
+
+gather_ReservedWords(syntactic.cfps) # for "but not ReservedWord"
+do_ASI_prep(syntactic.cfps)
+
+# Now that the cfps won't be modified any further:
+lexical.tabulate_points()
+syntactic.tabulate_points()
+
+# XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
+
 if __name__ == '__main__':
     # test
     script_text = '14* 3;\n'
@@ -1122,6 +1122,7 @@ def put(text):
 
 # XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
 
-main()
+if __name__ == '__main__':
+    main()
 
 # vim: sw=4 ts=4 expandtab
@@ -4,7 +4,7 @@
 #
 # Copyright (C) 2018  J. Michael Dyck <jmdyck@ibiblio.org>
 
-import sys, os, re, pickle, pdb, collections
+import sys, os, re, pickle, pdb, collections, bisect
 
 # XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
 
@@ -53,7 +53,7 @@ class _Spec:
 spec = _Spec()
 
 def install_spec_text(_spec_text):
-    global spec_text, _newline_posns
+    global spec_text, _newline_posns, _indentation_of_line_
     spec_text = _spec_text
 
     _newline_posns = [-1] + [mo.start() for mo in re.finditer('\n', spec_text)]
@@ -62,6 +62,9 @@ def install_spec_text(_spec_text):
     # (And we pretend that there's a line 0
     # that ends with a newline at position -1.)
 
+    _indentation_of_line_ = [None] + [len(mo.group(0)) for mo in re.finditer('(?m)^ *', spec_text)]
+    # _indentation_of_line_[i] is the number of leading spaces on line i (1-based).
+
 # XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
 
 class SpecNode:
@@ -101,6 +104,7 @@ class SpecNode:
 
 spec_text = None
 _newline_posns = None
+_indentation_of_line_ = None
 
 def convert_HTMLParser_getpos_to_posn(pos_tuple):
     (line_num, offset_within_line) = pos_tuple
@@ -135,6 +139,11 @@ def convert_posn_to_linecol(posn):
 
     return (line_num, col)
 
+def indentation_of_line_containing(posn):
+    # (If `posn` is at a newline, that's the line it ends.)
+    line_num = bisect.bisect_left(_newline_posns, posn)
+    return _indentation_of_line_[line_num]
+
 def source_line_with_caret_marking_column(posn):
     (line_num, col_num) = convert_posn_to_linecol(posn)
     source_line = spec_text[
@@ -9,10 +9,18 @@
 # test_parser.py --all && car _{fail,early,pass}_output
 # ^ takes about 2.5 minutes
 # test_parser.py --all-dir=fail && car _fail_output
+# test_parser.py --jobs=8 --all
+# ^ same output files, with the tests spread over 8 processes
+# test_parser.py --timing=50 --all
+# ^ also reports the 50 slowest files (default 20),
+#   and writes per-file timings and parser counters as CSV
+#   (The lexical memo is shared by all the files parsed in a process,
+#   so a file's lexical work depends on what was parsed before it;
+#   the memo hits/misses columns show how much it got from the memo.)
 
 # You may need to `export PYTHONIOENCODING=utf-8` before running this script.
 
-import sys, os, re, contextlib
+import sys, os, re, contextlib, io, time, multiprocessing, csv
 
 import es_parser
 import misc
@@ -20,24 +28,56 @@ import misc
 
 root_test_dirpath = "../test262-parser-tests"
 
+n_jobs = 1
+
+# If not None, a list of the parse_stats of each file tested.
+timing_records = None
+
 def main():
-    # By default the recursion limit is 1000.
-    # We need slightly more, to handle pass/dd3c63403db5c06e.js,
-    # which is like (((1))) but with 50 pairs of parentheses,
-    # each of which takes 22 levels of the parse tree.
-    # (And in final_check, we traverse the tree recursively.)
-    sys.setrecursionlimit(1150)
+    global n_jobs, timing_records
 
-    if sys.argv[1] == '--all':
+    set_recursion_limit()
+
+    args = sys.argv[1:]
+    n_slowest = None
+    while True:
+        mo = re.fullmatch(r'--jobs=(\d+)', args[0])
+        if mo:
+            n_jobs = int(mo.group(1))
+            assert n_jobs >= 1
+            args = args[1:]
+            continue
+        mo = re.fullmatch(r'--timing(?:=(\d+))?', args[0])
+        if mo:
+            n_slowest = int(mo.group(1) or 20)
+            timing_records = []
+            args = args[1:]
+            continue
+        break
+
+    if args[0] == '--all':
         test_all()
     else:
-        mo = re.fullmatch(r'--all-dir=(\w+)', sys.argv[1])
+        mo = re.fullmatch(r'--all-dir=(\w+)', args[0])
         if mo:
             dirname = mo.group(1)
             test_all_in_dir(dirname)
         else:
-            for file_relpath in sys.argv[1:]:
+            for file_relpath in args:
                 test_one(file_relpath)
+                if timing_records is not None:
+                    timing_records.append(last_parse_stats)
+
+    if timing_records is not None:
+        write_timing_report(n_slowest)
+
+def set_recursion_limit():
+    # By default the recursion limit is 1000.
+    # We need slightly more, to handle pass/dd3c63403db5c06e.js,
+    # which is like (((1))) but with 50 pairs of parentheses,
+    # each of which takes 22 levels of the parse tree.
+    # (And in final_check, we traverse the tree recursively.)
+    sys.setrecursionlimit(1150)
 
 def test_all():
     test_all_in_dir('fail')
@@ -49,16 +89,29 @@ def test_all_in_dir(dirname):
     assert dirname in ['fail', 'early', 'pass', 'pass-explicit']
     output_filename = f'_{dirname}_output.new'
 
+    dirpath = root_test_dirpath + "/" + dirname
+    file_relpaths = []
+    for filename in sorted(os.listdir(dirpath)):
+        assert filename.endswith('.js')
+        file_relpaths.append(dirname + '/' + filename)
+
+    start_time = time.time()
+    max_file_time = 0.0
+    slowest_file_relpath = None
+    n_failures = 0
+
     with open(output_filename, 'w', encoding='utf8') as f:
-        dirpath = root_test_dirpath + "/" + dirname
-        for i, filename in enumerate(sorted(os.listdir(dirpath))):
-            assert filename.endswith('.js')
+        for i, (file_relpath, result, file_time, parse_stats) in enumerate(each_test_result(file_relpaths, f)):
+            if timing_records is not None:
+                timing_records.append(parse_stats)
+
             if i % 20 == 0:
                 sys.stderr.write('.')
                 sys.stderr.flush()
-            file_relpath = dirname + '/' + filename
 
-            result = test_one(file_relpath, f)
+            if file_time > max_file_time:
+                max_file_time = file_time
+                slowest_file_relpath = file_relpath
 
             if file_relpath in corrections:
                 dirname_for_expectation_purposes = corrections[file_relpath]
@@ -69,10 +122,47 @@ def test_all_in_dir(dirname):
 
             if result != expected_result:
                 print(f"TEST {file_relpath} FAILED: expected {expected_result}, but got {result}", file=f)
+                n_failures += 1
         sys.stderr.write('\n')
         print('====', file=f)
         print('Done', file=f)
 
+    wall_time = time.time() - start_time
+    print(
+        f"{dirname}: {len(file_relpaths)} files in {wall_time:.1f}s"
+        f" (slowest: {slowest_file_relpath} at {max_file_time:.2f}s),"
+        f" {n_failures} failures",
+        file=sys.stderr
+    )
+
+def each_test_result(file_relpaths, f):
+    # For each file (in the given order),
+    # run test_one on it, with its output going to `f`,
+    # and generate (file_relpath, result, time taken, parse_stats).
+    if n_jobs == 1:
+        for file_relpath in file_relpaths:
+            file_start_time = time.time()
+            result = test_one(file_relpath, f)
+            yield (file_relpath, result, time.time() - file_start_time, last_parse_stats)
+    else:
+        # Each worker process imports es_parser (and so creates its parsers) just once.
+        # Each test's output is captured in the worker and written here,
+        # in the original order, so `f` gets the same content as in a serial run.
+        with multiprocessing.Pool(n_jobs, initializer=set_recursion_limit) as pool:
+            for (file_relpath, output, result, file_time, parse_stats) in pool.imap(
+                test_one_captured, file_relpaths, chunksize=4
+            ):
+                f.write(output)
+                yield (file_relpath, result, file_time, parse_stats)
+
+def test_one_captured(file_relpath):
+    # (runs in a worker process)
+    buffer = io.StringIO()
+    file_start_time = time.time()
+    result = test_one(file_relpath, buffer)
+    file_time = time.time() - file_start_time
+    return (file_relpath, buffer.getvalue(), result, file_time, last_parse_stats)
+
 def test_one(file_relpath, f=sys.stdout):
     print(file=f)
     print('===================', file=f)
@@ -85,10 +175,15 @@ def test_one(file_relpath, f=sys.stdout):
     # file_of_interest = '3dbb6e166b14a6c0.js'
     trace_level = (9 if filepath.endswith(file_of_interest) else 0)
     goal_symbol = 'Module' if filepath.endswith('.module.js') else 'Script'
+    es_parser.lexical.reset_stats()
+    es_parser.syntactic.reset_stats()
+    parse_start_time = time.time()
     try:
         node = es_parser.parse(source_text, goal_symbol, trace_level=trace_level, trace_f=f)
+        note_parse_stats(file_relpath, 'no error', parse_start_time)
         if trace_level > 0: node.dump()
     except es_parser.ParseError as pe:
+        note_parse_stats(file_relpath, 'ParseError', parse_start_time)
         print(file=f)
         print('ParseError:', file=f)
         print(misc.display_position_in_text(source_text, pe.posn), end='', file=f)
@@ -102,6 +197,76 @@ def test_one(file_relpath, f=sys.stdout):
     
     return 'no error'
 
+# ------------------------------------------------------------------------------
+
+last_parse_stats = None
+
+def note_parse_stats(file_relpath, result, parse_start_time):
+    global last_parse_stats
+    last_parse_stats = {
+        'file'                 : file_relpath,
+        'result'               : result,
+        'parse_seconds'        : time.time() - parse_start_time,
+        'syntactic_sets'       : es_parser.syntactic.n_sets,
+        'syntactic_peak_items' : es_parser.syntactic.peak_items_per_set,
+        'lexical_sets'         : es_parser.lexical.n_sets,
+        'lexical_peak_items'   : es_parser.lexical.peak_items_per_set,
+        'lexical_memo_hits'    : es_parser.lexical.n_memo_hits,
+        'lexical_memo_misses'  : es_parser.lexical.n_memo_misses,
+    }
+
+timing_fields = [
+    'file',
+    'result',
+    'parse_seconds',
+    'syntactic_sets',
+    'syntactic_peak_items',
+    'lexical_sets',
+    'lexical_peak_items',
+    'lexical_memo_hits',
+    'lexical_memo_misses',
+]
+
+def write_timing_report(n_slowest):
+    # A human-readable report of the slowest files:
+    total_time = sum(record['parse_seconds'] for record in timing_records)
+    slowest_records = sorted(
+        timing_records,
+        key=lambda record: record['parse_seconds'],
+        reverse=True
+    )[0:n_slowest]
+    with open('_timing_report.new', 'w', encoding='utf8') as f:
+        print(f"{len(slowest_records)} slowest of {len(timing_records)} parses (total {total_time:.1f}s):", file=f)
+        print(file=f)
+        print("  seconds   syn sets  syn peak   lex sets  lex peak   memo hits  misses  file", file=f)
+        for record in slowest_records:
+            print(
+                "%9.3f  %9d %9d  %9d %9d  %10d %7d  %s" % (
+                    record['parse_seconds'],
+                    record['syntactic_sets'],
+                    record['syntactic_peak_items'],
+                    record['lexical_sets'],
+                    record['lexical_peak_items'],
+                    record['lexical_memo_hits'],
+                    record['lexical_memo_misses'],
+                    record['file'],
+                ),
+                file=f
+            )
+
+    # And a machine-readable version of all of them,
+    # sorted by file, so that two runs can be diffed:
+    with open('_timing.csv.new', 'w', encoding='utf8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=timing_fields)
+        writer.writeheader()
+        for record in sorted(timing_records, key=lambda record: record['file']):
+            writer.writerow({
+                **record,
+                'parse_seconds': '%.4f' % record['parse_seconds']
+            })
+
+# ------------------------------------------------------------------------------
+
 corrections = {
     # These two are in 'early', but should be in 'fail'.
     # They raise a ParseError, but not due to an early error,
@@ -323,6 +488,7 @@ corrections = {
 # a633b3217b5b8026.js
 # aca911e336954a5b.js
 
-main()
+if __name__ == '__main__':
+    main()
 
 # vim: sw=4 ts=4 expandtab